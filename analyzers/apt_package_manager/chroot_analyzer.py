@@ -1,13 +1,13 @@
 import os
 import re
-import json
 import subprocess
 from rich import print
-from typing import Dict
+from typing import Any, Dict, List
 
 from ..output_formatting.apt_outputs import chroot_mode_entry_service
 from ..output_formatting.time_plot import AptTimeGraphPlot
 from ..output_formatting.cdx import convert_to_cdx_apt_chroot
+from ..output_formatting.cdx import save_cdx_output
 from ..package_utils.apt_utils import apt_utils
 
 
@@ -30,7 +30,7 @@ class apt_chroot_analysis:
         else:
             self.systemd_path: str = os.path.join(
                 self.volume_path, "etc/systemd/system")
-        self.out_data: str = ""
+        self.out_data: List[Dict[str, Any]] = []
         self.run_bootup_analysis()
         self.extract_service_times()
         self.service_analysis_process()
@@ -64,12 +64,10 @@ class apt_chroot_analysis:
         service_times = {}
 
         with open(self.image_path, 'r') as file:
-            for line in file:
-                match = re.search(pattern, line)
-                if match:
-                    service_name = match.group(1)
-                    time = match.group(2)
-                    service_times[service_name] = time
+            data = file.read()
+
+        for match in pattern.finditer(data):
+            service_times[match.group(1)] = match.group(2)
 
         self.extracted_info = service_times
 
@@ -105,14 +103,11 @@ class apt_chroot_analysis:
 
         combined_entries = chroot_mode_entry_service.combine_entries(entries)
 
-        self.out_data = json.dumps([entry.dict()
-                                   for entry in combined_entries], indent=4)
-        cdx_data = convert_to_cdx_apt_chroot(
-            self.out_data)
+        self.out_data = [entry.to_dict() for entry in combined_entries]
+        cdx_data = convert_to_cdx_apt_chroot(self.out_data)
         if self.output_opt:
             try:
-                with open(self.output_opt, 'w+') as out_file:
-                    out_file.write(json.dumps(cdx_data))
+                save_cdx_output(cdx_data, self.output_opt)
             except Exception as e:
                 print(f"Error writing to output file: {e}")
         utils.generate_table_chroot(entries=combined_entries)
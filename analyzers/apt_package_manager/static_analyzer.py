@@ -1,5 +1,5 @@
 import os
-import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 from rich import print
 
@@ -7,6 +7,7 @@ from ..output_formatting.apt_outputs import static_mode_entry_info
 from ..output_formatting.apt_outputs import static_mode_entry_service
 from ..output_formatting.cdx import convert_to_cdx_apt_static_info
 from ..output_formatting.cdx import convert_to_cdx_apt_static_service
+from ..output_formatting.cdx import save_cdx_output
 from ..package_utils.apt_utils import apt_utils
 
 
@@ -63,8 +64,7 @@ class static_analysis_info_files:
                 entry.custom_output() for entry in self.packages.values()
             ]
             cdx_out = convert_to_cdx_apt_static_info(serializable_packages)
-            with open(self.output_opt, 'w') as f:
-                json.dump(cdx_out, f, indent=4)
+            save_cdx_output(cdx_out, self.output_opt)
             print(f"Successfully saved packages to {self.output_opt}")
         except Exception as e:
             if self.output_opt == '':
@@ -103,9 +103,15 @@ class static_analysis_service_files:
 
             package_versions = self.utils.extract_version()
 
-            for service_file in service_files:
-                executable_paths = self.utils.extract_executable_paths(
-                    service_file)
+            # Unit parsing is I/O bound, overlap the open/read latency
+            with ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) * 4)
+            ) as executor:
+                executable_path_lists = list(executor.map(
+                    self.utils.extract_executable_paths, service_files))
+
+            for service_file, executable_paths in zip(
+                    service_files, executable_path_lists):
                 if not executable_paths:
                     continue
 
@@ -113,16 +119,15 @@ class static_analysis_service_files:
                     exec_paths=executable_paths,
                     package_versions=package_versions
                 )
+                exec_names = list(dict.fromkeys(
+                    os.path.basename(path) for path in executable_paths))
                 for package_name, version in info_files.items():
-                    exec_names_set = {os.path.basename(
-                        path) for path in executable_paths}
-
                     entry = static_mode_entry_service(
                         Package=package_name,
                         Version=version,
                         ServiceName=service_file,
                         ExecutablePath=list(executable_paths),
-                        ExecutableNames=list(exec_names_set)
+                        ExecutableNames=list(exec_names)
                     )
                     entries.append(entry)
             if not entries:
@@ -145,14 +150,13 @@ class static_analysis_service_files:
             if self.output_opt == '':
                 self.utils.generate_table_static_service(entries)
             else:
-                with open(self.output_opt, 'w+') as outfile:
-                    out_entry = []
-                    for entry in entries:
-                        if entry.Package:
-                            entry_json = entry.json()
-                            out_entry.append(entry_json)
-                    cdx_output = convert_to_cdx_apt_static_service(out_entry)
-                    outfile.write(json.dumps(cdx_output))
+                out_entry = []
+                for entry in entries:
+                    if entry.Package:
+                        entry_json = entry.json()
+                        out_entry.append(entry_json)
+                cdx_output = convert_to_cdx_apt_static_service(out_entry)
+                save_cdx_output(cdx_output, self.output_opt)
 
                 print(f"Output written to {self.output_opt}")
                 self.utils.generate_table_static_service(entries)
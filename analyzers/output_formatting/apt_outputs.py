@@ -2,6 +2,8 @@ import re
 from pydantic import BaseModel
 from typing import Dict, List, Any
 
+_DIGITS_RE = re.compile(r'\d+')
+
 
 class OutputFormatInterface:
     def custom_output(self) -> Dict[str, Any]:
@@ -31,6 +33,16 @@ class chroot_mode_entry_service(OutputFormatInterface, BaseModel):
     def json(self, *args, **kwargs) -> Dict[str, Any]:
         return self.custom_output()
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "Package": self.Package,
+            "ServiceName": self.ServiceName,
+            "ExecutablePath": list(self.ExecutablePath),
+            "ExecutableNames": list(self.ExecutableNames),
+            "ExecutionTime": self.ExecutionTime,
+            "Version": self.Version
+        }
+
     @classmethod
     def combine_entries(
             cls,
@@ -39,32 +51,33 @@ class chroot_mode_entry_service(OutputFormatInterface, BaseModel):
         if not isinstance(entries, list):
             raise ValueError("Entries should be provided as a list")
 
-        package_dict = {}
+        package_dict: Dict[str, List['chroot_mode_entry_service']] = {}
         for entry in entries:
             if not isinstance(entry, cls):
                 raise ValueError("Invalid entry type provided")
 
-            package_name = entry.Package
-            if package_name:
-                if package_name not in package_dict:
-                    package_dict[package_name] = entry
-                else:
-                    existing_entry = package_dict[package_name]
-                    existing_entry.ExecutablePath.extend(entry.ExecutablePath)
-                    existing_entry.ExecutableNames.extend(
-                        entry.ExecutableNames)
-                    existing_entry.ExecutablePath.sort()
-                    existing_entry.ExecutableNames.sort()
-                    execution_time_str = str(entry.ExecutionTime)
-                    try:
-                        existing_entry.ExecutionTime = str(
-                            re.search(r'\d+', execution_time_str).group())
-                    except (AttributeError, ValueError):
-                        raise ValueError("Invalid ExecutionTime format")
-                    if entry.Version > existing_entry.Version:
-                        existing_entry.Version = entry.Version
-
-        return list(package_dict.values())
+            if entry.Package:
+                package_dict.setdefault(entry.Package, []).append(entry)
+
+        combined = []
+        for existing_entry, *duplicates in package_dict.values():
+            for entry in duplicates:
+                existing_entry.ExecutablePath.extend(entry.ExecutablePath)
+                existing_entry.ExecutableNames.extend(entry.ExecutableNames)
+                execution_time_str = str(entry.ExecutionTime)
+                try:
+                    existing_entry.ExecutionTime = str(
+                        _DIGITS_RE.search(execution_time_str).group())
+                except (AttributeError, ValueError):
+                    raise ValueError("Invalid ExecutionTime format")
+                if entry.Version > existing_entry.Version:
+                    existing_entry.Version = entry.Version
+            if duplicates:
+                existing_entry.ExecutablePath.sort()
+                existing_entry.ExecutableNames.sort()
+            combined.append(existing_entry)
+
+        return combined
 
 
 class static_mode_entry_info(OutputFormatInterface, BaseModel):
@@ -119,31 +132,29 @@ class static_mode_entry_service(OutputFormatInterface, BaseModel):
         if not entries:
             raise ValueError("No entries provided")
         try:
-            package_dict = {}
+            package_dict: Dict[str, List['static_mode_entry_service']] = {}
             for entry in entries:
                 if not isinstance(entry, cls):
                     raise ValueError("Invalid entry type provided")
-                package_name = entry.Package
-                version = entry.Version
-                if package_name:
-                    if package_name not in package_dict:
-                        package_dict[package_name] = entry
-                    else:
-                        existing_entry = package_dict[package_name]
-                        # Merge executable paths and names
-                        existing_entry.ExecutablePath.extend(
-                            entry.ExecutablePath)
-                        existing_entry.ExecutableNames.extend(
-                            entry.ExecutableNames)
-                        existing_entry.ExecutablePath = sorted(
-                            set(existing_entry.ExecutablePath))
-                        existing_entry.ExecutableNames = sorted(
-                            set(existing_entry.ExecutableNames))
+                if entry.Package:
+                    package_dict.setdefault(entry.Package, []).append(entry)
+
+            combined = []
+            for existing_entry, *duplicates in package_dict.values():
+                if duplicates:
+                    # Merge executable paths and names once per package
+                    paths = list(existing_entry.ExecutablePath)
+                    names = list(existing_entry.ExecutableNames)
+                    for entry in duplicates:
+                        paths.extend(entry.ExecutablePath)
+                        names.extend(entry.ExecutableNames)
                         # Update version if available
-                        if version and not existing_entry.Version:
-                            existing_entry.Version = version
-            return cls.filter_duplicates_by_package(
-                list(package_dict.values()))
+                        if entry.Version and not existing_entry.Version:
+                            existing_entry.Version = entry.Version
+                    existing_entry.ExecutablePath = sorted(set(paths))
+                    existing_entry.ExecutableNames = sorted(set(names))
+                combined.append(existing_entry)
+            return cls.filter_duplicates_by_package(combined)
         except Exception as e:
             print(f"Error combining entries: {e}")
             return []
@@ -1,7 +1,18 @@
 import json
 import os
+import re
+from functools import lru_cache
+from urllib.parse import quote
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any
+from typing import Iterator, List, Dict, Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_OUTPUT_BUFFER_SIZE = 1 << 20
+_PURL_SAFE_RE = re.compile(r'[A-Za-z0-9.+~:_-]*')
 
 
 class CycloneDXComponent(BaseModel):
@@ -22,16 +33,20 @@ class CycloneDXComponent(BaseModel):
         }
 
 
-def get_linux_distribution():
+@lru_cache(maxsize=1)
+def get_linux_distribution() -> str:
+    os_release = {}
     if os.path.isfile("/etc/os-release"):
         with open("/etc/os-release", "r") as f:
             for line in f:
-                if line.startswith("ID="):
-                    dist_id = line.split("=")[1].strip().lower()
-                    if dist_id == "ubuntu" or dist_id == "debian":
-                        return "debian"
-                    elif dist_id == "centos" or dist_id == "rhel":
-                        return "redhat"
+                key, sep, value = line.strip().partition("=")
+                if sep:
+                    os_release[key] = value.strip("\"'")
+    dist_id = os_release.get("ID", "").lower()
+    if dist_id == "ubuntu" or dist_id == "debian":
+        return "debian"
+    elif dist_id == "centos" or dist_id == "rhel":
+        return "redhat"
     if os.path.isfile("/etc/debian_version"):
         return "debian"
     elif os.path.isfile("/etc/redhat-release"):
@@ -40,17 +55,89 @@ def get_linux_distribution():
         return "unknown"
 
 
+def _purl_quote(value: str) -> str:
+    if _PURL_SAFE_RE.fullmatch(value):
+        return value
+    return quote(value, safe='+~:')
+
+
+def build_purl(purl_prefix: str, name: str, version: str) -> str:
+    return purl_prefix + _purl_quote(str(name)) + "@" + \
+        _purl_quote(str(version))
+
+
+def _encode_json(value: Any, depth: int) -> bytes:
+    if orjson is not None:
+        data = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(
+            value, indent=2, ensure_ascii=False).encode('utf-8')
+    # JSON strings cannot contain raw newlines, so this only re-indents
+    return data.replace(b"\n", b"\n" + b"  " * depth)
+
+
+def iter_cdx_chunks(bom: Dict[str, Any]) -> Iterator[bytes]:
+    if not bom:
+        yield b"{}"
+        return
+
+    yield b"{"
+    for index, (key, value) in enumerate(bom.items()):
+        yield (b",\n  " if index else b"\n  ") + _encode_json(key, 1) + b": "
+        if isinstance(value, list) and value:
+            # Encode list items (components) one at a time
+            yield b"["
+            for item_index, item in enumerate(value):
+                yield (b",\n    " if item_index else b"\n    ") + \
+                    _encode_json(item, 2)
+            yield b"\n  ]"
+        else:
+            yield _encode_json(value, 1)
+    yield b"\n}"
+
+
+def _rewrite_cdx_output(bom: Dict[str, Any], output_path: str) -> None:
+    with open(output_path, 'r+b', buffering=_OUTPUT_BUFFER_SIZE) as out_file:
+        chunks = iter_cdx_chunks(bom)
+        # Compare against the existing bytes and only start writing at the
+        # first chunk that differs
+        for chunk in chunks:
+            offset = out_file.tell()
+            if out_file.read(len(chunk)) != chunk:
+                out_file.seek(offset)
+                out_file.write(chunk)
+                break
+        else:
+            if out_file.read(1):
+                out_file.truncate(out_file.tell() - 1)
+            return
+
+        for chunk in chunks:
+            out_file.write(chunk)
+        out_file.truncate()
+
+
+def save_cdx_output(bom: Dict[str, Any], output_path: str) -> None:
+    if os.path.isfile(output_path):
+        _rewrite_cdx_output(bom, output_path)
+        return
+
+    with open(output_path, 'wb', buffering=_OUTPUT_BUFFER_SIZE) as out_file:
+        for chunk in iter_cdx_chunks(bom):
+            out_file.write(chunk)
+
+
 def convert_to_cdx_apt_static_service(
         json_data: List[Dict[str, Any]]) -> Dict[str, Any]:
     components = []
-    os = get_linux_distribution()
+    purl_prefix = f"pkg:{get_linux_distribution()}/"
     for entry in json_data:
         name = entry["Package"]
         version = entry['ServiceInformation']['Version']
         component = CycloneDXComponent(
             name=name,
             version=version,
-            purl=f"pkg:{os}/{name}@{version}"
+            purl=build_purl(purl_prefix, name, version)
         )
         components.append(component.custom_output())
 
@@ -66,14 +153,14 @@ def convert_to_cdx_apt_static_service(
 def convert_to_cdx_rpm_static_service(
         json_data: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
     components = []
-    os = get_linux_distribution()
+    purl_prefix = f"pkg:{get_linux_distribution()}/"
     for package, package_data in json_data.items():
         name = package
         version = package_data["package_version"]
         component = {
             "name": name,
             "version": version,
-            "purl": f"pkg:{os}/{name}@{version}"
+            "purl": build_purl(purl_prefix, name, version)
         }
         components.append(component)
 
@@ -84,7 +171,7 @@ def convert_to_cdx_rpm_static_service(
                 service_component = {
                     "name": service_name,
                     "version": service_version,
-                    "purl": f"pkg:{os}/{name}@{service_version}"
+                    "purl": build_purl(purl_prefix, name, service_version)
                 }
                 components.append(service_component)
 
@@ -106,7 +193,7 @@ def convert_to_cdx_rpm_chroot(data):
             return []
 
     components = []
-    os = get_linux_distribution()
+    purl_prefix = f"pkg:{get_linux_distribution()}/"
     for package_name, package_data in data.items():
         package_version = package_data['PackageVersion']
 
@@ -114,7 +201,7 @@ def convert_to_cdx_rpm_chroot(data):
             component = {
                 "name": package_name,
                 "version": package_version,
-                "purl": f"pkg:{os}/{package_name}@{package_version}"
+                "purl": build_purl(purl_prefix, package_name, package_version)
             }
             components.append(component)
 
@@ -129,14 +216,14 @@ def convert_to_cdx_rpm_chroot(data):
 
 def convert_to_cdx_apt_static_info(json_data: str) -> Dict[str, Any]:
     components = []
-    os = get_linux_distribution()
+    purl_prefix = f"pkg:{get_linux_distribution()}/"
     for entry in json_data:
         name = entry["Package"]
         version = entry['ServiceInformation']['Version']
         component = CycloneDXComponent(
             name=name,
             version=version,
-            purl=f"pkg:{os}/{name}@{version}"
+            purl=build_purl(purl_prefix, name, version)
         )
         components.append(component.custom_output())
 
@@ -149,21 +236,23 @@ def convert_to_cdx_apt_static_info(json_data: str) -> Dict[str, Any]:
     return bom
 
 
-def convert_to_cdx_apt_chroot(json_data: str) -> Dict[str, Any]:
-    try:
-        data = json.loads(json_data)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Error decoding JSON data: {e}")
+def convert_to_cdx_apt_chroot(
+        json_data: Union[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    if isinstance(json_data, str):
+        try:
+            json_data = json.loads(json_data)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Error decoding JSON data: {e}")
 
     components = []
-    os = get_linux_distribution()
-    for entry in data:
+    purl_prefix = f"pkg:{get_linux_distribution()}/"
+    for entry in json_data:
         name = entry["Package"]
-        version = entry['ServiceInformation']['Version']
+        version = entry["Version"]
         component = CycloneDXComponent(
             name=name,
             version=version,
-            purl=f"pkg:{os}/{name}@{version}"
+            purl=build_purl(purl_prefix, name, version)
         )
         components.append(component.custom_output())
 
@@ -1,24 +1,76 @@
 import os
 import json
 import graphviz
-from typing import Dict, Any
+from typing import Dict, List, Any, Set, Tuple, Union
+
+_LINE_STYLES = {
+    "before": {"style": "dashed", "color": "blue", "width": "2"},
+    "after": {"style": "dotted", "color": "red", "width": "2"},
+    "package": {"style": "solid", "color": "grey", "width": "2"}
+}
+_DEPENDENCY_NODE_ATTRS = {
+    "shape": "ellipse", "style": "filled", "fillcolor": "white",
+    "rank": "same"
+}
+
+
+def scan_unit_files(service_files_path: str) -> Dict[str, str]:
+    try:
+        with os.scandir(service_files_path) as entries:
+            return {
+                entry.name: entry.path for entry in entries
+                if entry.name.endswith(".service") and entry.is_file()
+            }
+    except OSError:
+        return {}
+
+
+def _find_key_values(data: bytes, key: bytes) -> List[str]:
+    values = []
+    needle = b"\n" + key
+    pos = 0 if data.startswith(key) else data.find(needle)
+    while pos != -1:
+        start = data.index(b"=", pos) + 1
+        end = data.find(b"\n", start)
+        if end == -1:
+            end = len(data)
+        values.extend(
+            name.decode('utf-8', errors='ignore')
+            for name in data[start:end].split())
+        pos = data.find(needle, end)
+    return values
+
+
+def parse_unit_dependencies(unit_path: str) -> Tuple[List[str], List[str]]:
+    with open(unit_path, 'rb') as f:
+        data = f.read()
+    before = _find_key_values(data, b"Before=") if b"Before=" in data else []
+    after = _find_key_values(data, b"After=") if b"After=" in data else []
+    return before, after
 
 
 class RpmTimeGraphPlot:
-    def __init__(self, service_files_path: str, json_data: str) -> None:
+    def __init__(
+            self,
+            service_files_path: str,
+            json_data: Union[str, Dict[str, Any]]) -> None:
         self.service_files_path: str = service_files_path
-        self.json_data: str = json_data
+        self.json_data: Union[str, Dict[str, Any]] = json_data
         self.service_data: Dict[str, Any] = {}
         self.render_process_run()
 
     def parse_service_files(self) -> Dict[str, Any]:
         result = {}
 
-        try:
-            data_dict = json.loads(self.json_data)
-        except json.JSONDecodeError as e:
-            print(f"Error decoding JSON data: {e}")
-            return result
+        data_dict = self.json_data
+        if isinstance(data_dict, str):
+            try:
+                data_dict = json.loads(data_dict)
+            except json.JSONDecodeError as e:
+                print(f"Error decoding JSON data: {e}")
+                return result
+
+        unit_files = scan_unit_files(self.service_files_path)
 
         for package_name, package_info in data_dict.items():
             service_files = package_info.get("ServiceFiles", [])
@@ -41,26 +93,20 @@ class RpmTimeGraphPlot:
                 if "ms" in exec_time:
                     exec_time = int(''.join(filter(str.isdigit, exec_time)))
 
-                service_file_path = os.path.join(
-                    self.service_files_path, service_name)
-
-                if os.path.exists(service_file_path):
-                    with open(service_file_path, 'r') as f:
-                        lines = f.readlines()
-                        before = []
-                        after = []
-                        for line in lines:
-                            if line.startswith("Before="):
-                                before.extend(
-                                    line.strip().split('=')[1].split())
-                            elif line.startswith("After="):
-                                after.extend(
-                                    line.strip().split('=')[1].split())
-                        package_services[service_name] = {
-                            "Before": before,
-                            "After": after,
-                            "ExecutionTime": exec_time
-                        }
+                service_file_path = unit_files.get(service_name)
+
+                if service_file_path:
+                    try:
+                        before, after = parse_unit_dependencies(
+                            service_file_path)
+                    except OSError:
+                        print(f"Service file not found for {service_name}")
+                        continue
+                    package_services[service_name] = {
+                        "Before": before,
+                        "After": after,
+                        "ExecutionTime": exec_time
+                    }
                 else:
                     print(f"Service file not found for {service_name}")
 
@@ -74,81 +120,89 @@ class RpmTimeGraphPlot:
             comment='Service Execution Flowchart', format='png')
         dot.attr(rankdir='LR', nodesep='1', fontsize='11', splines='ortho')
 
-        line_styles = {
-            "before": {"style": "dashed", "color": "blue", "width": "2"},
-            "after": {"style": "dotted", "color": "red", "width": "2"},
-            "package": {"style": "solid", "color": "grey", "width": "2"}
-        }
-
         dot.node("legend_header", label="Legend", shape='plaintext',
                  fontsize='16', fontcolor='black')
         dot.node("legend_before", label="Before", shape='rectangle',
-                 style='filled', fillcolor=line_styles["before"]["color"])
+                 style='filled', fillcolor=_LINE_STYLES["before"]["color"])
         dot.node("legend_after", label="After", shape='rectangle',
-                 style='filled', fillcolor=line_styles["after"]["color"])
+                 style='filled', fillcolor=_LINE_STYLES["after"]["color"])
         dot.node("legend_package", label="Package", shape='rectangle',
-                 style='filled', fillcolor=line_styles["package"]["color"])
+                 style='filled', fillcolor=_LINE_STYLES["package"]["color"])
 
         dot.edge(
             "legend_header", "legend_before", label=" ",
-            style=line_styles["before"]["style"],
-            color=line_styles["before"]["color"])
+            style=_LINE_STYLES["before"]["style"],
+            color=_LINE_STYLES["before"]["color"])
         dot.edge(
             "legend_header", "legend_after", label=" ",
-            style=line_styles["after"]["style"],
-            color=line_styles["after"]["color"])
+            style=_LINE_STYLES["after"]["style"],
+            color=_LINE_STYLES["after"]["color"])
         dot.edge(
             "legend_header", "legend_package", label=" ",
-            style=line_styles["package"]["style"],
-            color=line_styles["package"]["color"])
+            style=_LINE_STYLES["package"]["style"],
+            color=_LINE_STYLES["package"]["color"])
 
         dot.node("System_Init", label="System Init", shape='rectangle',
                  style='filled', fillcolor='lightblue', rank='max')
 
-        processed_nodes = set()
+        emitted_services: Set[str] = set()
+        emitted_nodes: Set[str] = set()
+        emitted_edges: Set[Tuple[str, str, str]] = set()
+        package_fill = _LINE_STYLES["package"]["color"]
+        package_edge_style = _LINE_STYLES["package"]["style"]
+        before_edge_attrs = {
+            "label": "Before",
+            "style": _LINE_STYLES["before"]["style"],
+            "color": _LINE_STYLES["before"]["color"]
+        }
+        after_edge_attrs = {
+            "label": "After",
+            "style": _LINE_STYLES["after"]["style"],
+            "color": _LINE_STYLES["after"]["color"]
+        }
 
         for package_name, services in self.service_data.items():
             dot.node(
                 package_name, label=package_name, shape='rectangle',
-                style='filled',
-                fillcolor=line_styles["package"]["color"], rank='same')
+                style='filled', fillcolor=package_fill, rank='same')
 
-            dot.edge("System_Init", package_name,
-                     style=line_styles["package"]["style"])
+            dot.edge("System_Init", package_name, style=package_edge_style)
 
             for service_name, details in services.items():
                 execution_time = details.get("ExecutionTime", "")
                 service_label = f"""
                 {service_name}\n({execution_time} ms)
                 """ if execution_time else service_name
-                dot.node(service_name, label=service_label, shape='ellipse',
-                         style='filled', fillcolor='white', rank='same')
+                if service_name not in emitted_services:
+                    dot.node(service_name, label=service_label,
+                             shape='ellipse', style='filled',
+                             fillcolor='white', rank='same')
+                    emitted_services.add(service_name)
+                    emitted_nodes.add(service_name)
 
                 dot.edge(package_name, service_name)
 
                 for before_service in details.get("Before", []):
-                    if before_service in processed_nodes:
+                    if before_service not in emitted_nodes:
+                        dot.node(before_service, label=before_service,
+                                 **_DEPENDENCY_NODE_ATTRS)
+                        emitted_nodes.add(before_service)
+                    edge_key = (before_service, service_name, "before")
+                    if edge_key in emitted_edges:
                         continue
-                    dot.node(before_service, label=before_service,
-                             shape='ellipse',
-                             style='filled', fillcolor='white', rank='same')
-                    dot.edge(before_service, service_name, label="Before",
-                             style=line_styles["before"]["style"],
-                             color=line_styles["before"]["color"])
-                    processed_nodes.add(before_service)
+                    dot.edge(before_service, service_name, **before_edge_attrs)
+                    emitted_edges.add(edge_key)
 
                 for after_service in details.get("After", []):
-                    if after_service in processed_nodes:
+                    if after_service not in emitted_nodes:
+                        dot.node(after_service, label=after_service,
+                                 **_DEPENDENCY_NODE_ATTRS)
+                        emitted_nodes.add(after_service)
+                    edge_key = (service_name, after_service, "after")
+                    if edge_key in emitted_edges:
                         continue
-                    dot.node(after_service, label=after_service,
-                             shape='ellipse',
-                             style='filled', fillcolor='white', rank='same')
-                    dot.edge(service_name, after_service, label="After",
-                             style=line_styles["after"]["style"],
-                             color=line_styles["after"]["color"])
-                    processed_nodes.add(after_service)
-
-                processed_nodes.add(service_name)
+                    dot.edge(service_name, after_service, **after_edge_attrs)
+                    emitted_edges.add(edge_key)
 
         try:
             dot.render('service_flowchart', cleanup=True)
@@ -174,7 +228,9 @@ class RpmTimeGraphPlot:
 
 class AptTimeGraphPlot:
     def __init__(
-            self, service_files_path: str, json_data: Dict[str, Any]) -> None:
+            self,
+            service_files_path: str,
+            json_data: Union[str, List[Dict[str, Any]]]) -> None:
         self.service_files_path = service_files_path
         self.json_data = json_data
         self.service_data = self.parse_service_data()
@@ -183,11 +239,15 @@ class AptTimeGraphPlot:
 
     def parse_service_data(self) -> Dict[str, Any]:
         service_data = {}
-        try:
-            json_data = json.loads(self.json_data)
-        except json.JSONDecodeError as e:
-            print(f"Error decoding JSON data: {e}")
-            return service_data
+        json_data = self.json_data
+        if isinstance(json_data, str):
+            try:
+                json_data = json.loads(json_data)
+            except json.JSONDecodeError as e:
+                print(f"Error decoding JSON data: {e}")
+                return service_data
+
+        unit_files = scan_unit_files(self.service_files_path)
 
         for package_data in json_data:
             package_name = package_data.get("Package")
@@ -202,23 +262,16 @@ class AptTimeGraphPlot:
 
             package_services = {}
             for service_name in service_names:
-                service_file_path = os.path.join(
-                    self.service_files_path, f"{service_name}.service")
-                if os.path.exists(service_file_path):
-                    with open(service_file_path, 'r') as f:
-                        lines = f.readlines()
-                        before = []
-                        after = []
-                        for line in lines:
-                            if line.startswith("Before="):
-                                before.extend(
-                                    line.strip().split('=')[1].split())
-                            elif line.startswith("After="):
-                                after.extend(
-                                    line.strip().split('=')[1].split())
-                        package_services[service_name] = {
-                            "Before": before, "After": after,
-                            "ExecutionTime": exec_time}
+                service_file_path = unit_files.get(f"{service_name}.service")
+                if service_file_path:
+                    try:
+                        before, after = parse_unit_dependencies(
+                            service_file_path)
+                    except OSError:
+                        continue
+                    package_services[service_name] = {
+                        "Before": before, "After": after,
+                        "ExecutionTime": exec_time}
                 else:
                     continue
 
@@ -234,88 +287,93 @@ class AptTimeGraphPlot:
             comment='Service Execution Flowchart', format='png')
         dot.attr(rankdir='LR', nodesep='1', fontsize='11', splines='ortho')
 
-        line_styles = {
-            "before": {"style": "dashed", "color": "blue", "width": "2"},
-            "after": {"style": "dotted", "color": "red", "width": "2"},
-            "package": {"style": "solid", "color": "grey", "width": "2"}
-        }
-
         dot.node("legend_header", label="Legend", shape='plaintext',
                  fontsize='16', fontcolor='black')
         dot.node("legend_before", label="Before", shape='rectangle',
-                 style='filled', fillcolor=line_styles["before"]["color"])
+                 style='filled', fillcolor=_LINE_STYLES["before"]["color"])
         dot.node("legend_after", label="After", shape='rectangle',
-                 style='filled', fillcolor=line_styles["after"]["color"])
+                 style='filled', fillcolor=_LINE_STYLES["after"]["color"])
         dot.node("legend_package", label="Package", shape='rectangle',
-                 style='filled', fillcolor=line_styles["package"]["color"])
+                 style='filled', fillcolor=_LINE_STYLES["package"]["color"])
 
         dot.edge(
             "legend_header",
             "legend_before", label=" ",
-            style=line_styles["before"]["style"],
-            color=line_styles["before"]["color"])
+            style=_LINE_STYLES["before"]["style"],
+            color=_LINE_STYLES["before"]["color"])
         dot.edge(
             "legend_header",
             "legend_after", label=" ",
-            style=line_styles["after"]["style"],
-            color=line_styles["after"]["color"])
+            style=_LINE_STYLES["after"]["style"],
+            color=_LINE_STYLES["after"]["color"])
         dot.edge(
             "legend_header", "legend_package", label=" ",
-            style=line_styles["package"]["style"],
-            color=line_styles["package"]["color"])
+            style=_LINE_STYLES["package"]["style"],
+            color=_LINE_STYLES["package"]["color"])
 
         dot.node("System_Init", label="System Init", shape='rectangle',
                  style='filled', fillcolor='lightblue', rank='max')
 
-        processed_nodes = set()
+        emitted_services: Set[str] = set()
+        emitted_nodes: Set[str] = set()
+        emitted_edges: Set[Tuple[str, str, str]] = set()
+        package_fill = _LINE_STYLES["package"]["color"]
+        package_edge_style = _LINE_STYLES["package"]["style"]
+        before_edge_attrs = {
+            "style": _LINE_STYLES["before"]["style"],
+            "color": _LINE_STYLES["before"]["color"]
+        }
+        after_edge_attrs = {
+            "style": _LINE_STYLES["after"]["style"],
+            "color": _LINE_STYLES["after"]["color"]
+        }
 
         for package_name, services in self.service_data.items():
             dot.node(
                 package_name, label=package_name, shape='rectangle',
-                style='filled', fillcolor=line_styles["package"]["color"],
-                rank='same')
+                style='filled', fillcolor=package_fill, rank='same')
 
-            dot.edge("System_Init", package_name,
-                     style=line_styles["package"]["style"])
+            dot.edge("System_Init", package_name, style=package_edge_style)
 
             for service_name, details in services.items():
                 execution_time = details.get("ExecutionTime", "")
                 service_label = f"""
                 {service_name}\n({execution_time} ms)
                 """ if execution_time else service_name
-                dot.node(service_name, label=service_label,
-                         shape='ellipse', style='filled', fillcolor='white')
+                if service_name not in emitted_services:
+                    dot.node(service_name, label=service_label,
+                             shape='ellipse', style='filled',
+                             fillcolor='white')
+                    emitted_services.add(service_name)
+                    emitted_nodes.add(service_name)
 
                 dot.edge(package_name, service_name)
 
                 for before_service in details.get("Before", []):
-                    if before_service in processed_nodes:
+                    if before_service not in emitted_nodes:
+                        dot.node(
+                            before_service, label=before_service,
+                            **_DEPENDENCY_NODE_ATTRS)
+                        emitted_nodes.add(before_service)
+                    edge_key = (before_service, service_name, "before")
+                    if edge_key in emitted_edges:
                         continue
-                    dot.node(
-                        before_service,
-                        label=before_service, shape='ellipse',
-                        style='filled', fillcolor='white', rank='same')
                     dot.edge(
-                        before_service, service_name,
-                        style=line_styles["before"]["style"],
-                        color=line_styles["before"]["color"])
-                    processed_nodes.add(before_service)
+                        before_service, service_name, **before_edge_attrs)
+                    emitted_edges.add(edge_key)
 
                 for after_service in details.get("After", []):
-                    if after_service in processed_nodes:
+                    if after_service not in emitted_nodes:
+                        dot.node(
+                            after_service, label=after_service,
+                            **_DEPENDENCY_NODE_ATTRS)
+                        emitted_nodes.add(after_service)
+                    edge_key = (service_name, after_service, "after")
+                    if edge_key in emitted_edges:
                         continue
-                    dot.node(
-                        after_service,
-                        label=after_service,
-                        shape='ellipse',
-                        style='filled', fillcolor='white', rank='same')
                     dot.edge(
-                        service_name, after_service,
-                        style=line_styles["after"]["style"],
-                        color=line_styles["after"]["color"])
-                    processed_nodes.add(after_service)
-
-                processed_nodes.add(service_name)
+                        service_name, after_service, **after_edge_attrs)
+                    emitted_edges.add(edge_key)
 
         try:
             dot.render('service_flowchart', cleanup=True)
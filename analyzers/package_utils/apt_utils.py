@@ -1,12 +1,17 @@
 import os
 import re
+import stat
 from rich import print
 from rich.table import Table
-from typing import List, Union, Dict, Optional
+from typing import List, Union, Dict, Optional, Tuple
 
 from ..output_formatting.apt_outputs import chroot_mode_entry_service
 from ..output_formatting.apt_outputs import static_mode_entry_service
 
+_SERVICE_ENTRY_RE = re.compile(r'\.service\b(?![.\w])')
+_EXEC_LINE_RE = re.compile(r'(Exec(?:Start|Stop|Pre)?=)(.+)')
+_EXEC_PATH_RE = re.compile(r'Exec(?:Start|Stop|Pre)?=(\S+)')
+
 
 class apt_utils:
     def __init__(
@@ -21,7 +26,10 @@ class apt_utils:
         self.systemd_path = systemd_path
         self.info_path = info_path
         self.volume_path = volume_path
-        pass
+        self._package_versions: Optional[Dict[str, str]] = None
+        self._executable_paths_cache: Dict[str, List[str]] = {}
+        self._file_owners: Optional[Dict[str, List[str]]] = None
+        self._package_order: Dict[str, int] = {}
 
     """
     LISTING SERVICE FILES
@@ -36,15 +44,16 @@ class apt_utils:
                 if os.path.exists(list_file_path):
                     with open(list_file_path, 'r') as file:
                         for line in file:
-                            if re.search(r'\.service\b(?![.\w])', line):
+                            if _SERVICE_ENTRY_RE.search(line):
                                 service_files.append(line.strip())
 
             else:
                 if os.path.exists(self.systemd_path):
-                    service_files.extend([
-                        file for file in os.listdir(self.systemd_path)
-                        if file.endswith(".service")
-                    ])
+                    with os.scandir(self.systemd_path) as entries:
+                        service_files.extend([
+                            entry.name for entry in entries
+                            if entry.name.endswith(".service")
+                        ])
 
         except OSError as e:
             print(f"Error analyzing service files: {e}")
@@ -55,38 +64,43 @@ class apt_utils:
     EXTRACT PACKAGE VERSIONS
     """
 
+    def load_package_versions(self) -> Dict[str, str]:
+        if self._package_versions is not None:
+            return self._package_versions
+
+        package_versions = {}
+        with open(
+                self.dpkg_status_path,
+                'r', encoding='utf-8',
+                errors='ignore'
+        ) as status_file:
+            current_package = None
+
+            for line in status_file:
+                line = line.strip()
+
+                if line.startswith('Package:'):
+                    current_package = line.split(': ')[1]
+                    package_versions[current_package] = ''
+                elif line.startswith('Version:') and current_package:
+                    package_versions[current_package] = line.split(': ')[1]
+                elif line == '' and current_package:
+                    current_package = None
+
+        self._package_versions = package_versions
+        return package_versions
+
     def extract_version(
             self,
             package_name: Optional[str] = None
     ) -> Union[str, Dict[str, str]]:
         try:
-            package_versions = {}
-            with open(
-                    self.dpkg_status_path,
-                    'r', encoding='utf-8',
-                    errors='ignore'
-            ) as status_file:
-                current_package = None
-
-                for line in status_file:
-                    line = line.strip()
-
-                    if line.startswith('Package:'):
-                        current_package = line.split(': ')[1]
-                        if not package_name or current_package == package_name:
-                            package_versions[current_package] = ''
-                    elif line.startswith('Version:') and current_package:
-                        if not package_name or current_package == package_name:
-                            package_versions[
-                                current_package] = line.split(': ')[
-                                1]
-                    elif line == '' and current_package:
-                        current_package = None
+            package_versions = self.load_package_versions()
 
             if package_name:
                 return package_versions.get(package_name, None)
             else:
-                return package_versions
+                return dict(package_versions)
 
         except FileNotFoundError as e:
             print(f"Error: {self.dpkg_status_path} not found. {e}")
@@ -100,6 +114,10 @@ class apt_utils:
     """
 
     def extract_executable_paths(self, name_or_service_file: str) -> List[str]:
+        cached_paths = self._executable_paths_cache.get(name_or_service_file)
+        if cached_paths is not None:
+            return list(cached_paths)
+
         executable_paths = []
 
         try:
@@ -108,17 +126,16 @@ class apt_utils:
 
             if os.path.exists(service_file_path):
                 with open(service_file_path, 'r') as file:
-                    content = file.read()
-                    matches = re.findall(
-                        r'(Exec(?:Start|Stop|Pre)?=)(.+)', content)
-                    for match in matches:
-                        args = match[1].split()
+                    for line in file:
+                        if "Exec" not in line:
+                            continue
+                        match = _EXEC_LINE_RE.search(line)
+                        if not match:
+                            continue
+                        args = match.group(2).split()
                         path = args[0].strip()
-                        if os.path.isfile(path):
-                            if os.path.islink(path):
-                                real_path = os.path.realpath(path)
-                            else:
-                                real_path = os.path.abspath(path)
+                        real_path = self.resolve_executable_path(path)
+                        if real_path:
                             executable_paths.append(real_path)
             else:
                 service_path_mounted = os.path.join(
@@ -127,8 +144,9 @@ class apt_utils:
                 if os.path.exists(service_path_mounted):
                     with open(service_path_mounted, 'r') as file:
                         for line in file:
-                            match = re.search(
-                                r'Exec(?:Start|Stop|Pre)?=(\S+)', line)
+                            if "Exec" not in line:
+                                continue
+                            match = _EXEC_PATH_RE.search(line)
                             if match:
                                 executable_path = match.group(1)
                                 if os.path.islink(executable_path):
@@ -142,36 +160,62 @@ class apt_utils:
         except Exception as e:
             print(f"Error extracting executable paths: {e}")
 
-        return executable_paths
+        executable_paths = list(dict.fromkeys(executable_paths))
+        self._executable_paths_cache[name_or_service_file] = executable_paths
+        return list(executable_paths)
+
+    def resolve_executable_path(self, path: str) -> Optional[str]:
+        try:
+            st = os.lstat(path)
+        except OSError:
+            return None
+
+        if stat.S_ISREG(st.st_mode):
+            return os.path.abspath(path)
+        if stat.S_ISLNK(st.st_mode) and os.path.isfile(path):
+            return os.path.realpath(path)
+        return None
 
     """
     LISTING INFO FILES
     """
 
+    def load_file_owners(self) -> Tuple[Dict[str, List[str]], Dict[str, int]]:
+        if self._file_owners is not None:
+            return self._file_owners, self._package_order
+
+        file_owners: Dict[str, List[str]] = {}
+        package_order: Dict[str, int] = {}
+        if os.path.exists(self.info_path):
+            with os.scandir(self.info_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".list"):
+                        continue
+                    package_name = os.path.splitext(entry.name)[0]
+                    package_order[package_name] = len(package_order)
+                    with open(entry.path, 'r') as list_file:
+                        for line in list_file:
+                            file_owners.setdefault(
+                                line.rstrip("\n"), []).append(package_name)
+
+        self._file_owners = file_owners
+        self._package_order = package_order
+        return file_owners, package_order
+
     def analyze_info(
             self,
             exec_paths: List[str],
             package_versions: Dict[str, str] = None
     ) -> Union[List[str], Dict[str, str]]:
         try:
-            info_files = []
-
-            if os.path.exists(self.info_path):
-                for file_name in os.listdir(self.info_path):
-                    if file_name.endswith(".list"):
-                        list_file_path = os.path.join(
-                            self.info_path, file_name)
-                        with open(list_file_path, 'r') as list_file:
-                            content = list_file.read()
-
-                            for exec_path in exec_paths:
-                                real_path = os.path.realpath(
-                                    exec_path) if os.path.islink(
-                                    exec_path) else os.path.abspath(exec_path)
-                                if real_path in content:
-                                    info_files.append(
-                                        os.path.splitext(file_name)[0])
-                                    break
+            file_owners, package_order = self.load_file_owners()
+            owners = set()
+            for exec_path in exec_paths:
+                real_path = os.path.realpath(
+                    exec_path) if os.path.islink(
+                    exec_path) else os.path.abspath(exec_path)
+                owners.update(file_owners.get(real_path, ()))
+            info_files = sorted(owners, key=package_order.__getitem__)
 
             if package_versions is not None:
                 info_files_with_versions = {}
@@ -192,9 +236,10 @@ class apt_utils:
         try:
             files_with_list_extension = []
             if os.path.exists(self.info_path):
-                for filename in os.listdir(self.info_path):
-                    if filename.endswith(".list"):
-                        files_with_list_extension.append(filename)
+                with os.scandir(self.info_path) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".list"):
+                            files_with_list_extension.append(entry.name)
 
             return files_with_list_extension
 
@@ -218,16 +263,14 @@ class apt_utils:
         table.add_column("Execution Time")
 
         for entry in entries:
-            package_name = entry.Package if entry.Package else ""
-            service_name = entry.ServiceName
-            version = entry.Version
-            executable_paths = "\n".join(entry.ExecutablePath)
-            executable_names = "\n".join(entry.ExecutableNames)
-            execution_time = [str(entry.ExecutionTime)]
-            execution_time_str = "\n".join(execution_time)
-            table.add_row(package_name, version, service_name,
-                          executable_paths,
-                          executable_names, execution_time_str)
+            table.add_row(
+                entry.Package or "",
+                entry.Version,
+                entry.ServiceName,
+                "\n".join(entry.ExecutablePath),
+                "\n".join(entry.ExecutableNames),
+                str(entry.ExecutionTime)
+            )
 
         print(table)
 
@@ -1,9 +1,13 @@
 import os
 import re
+import rpm
 import json
 from rich import print
 from rich.table import Table
-from typing import List, Set
+from typing import Any, Dict, List, Set, Union
+
+_EXEC_LINE_RE = re.compile(r'(Exec(?:Start|Stop|Pre)?=)(.+)')
+_COMMAND_PATH_RE = re.compile(r'^[a-zA-Z0-9_./-]+')
 
 
 class rpm_utils:
@@ -14,7 +18,14 @@ class rpm_utils:
     ) -> None:
         self.systemd_path = systemd_path
         self.volume_path = volume_path
-        pass
+        self._transaction_set = None
+
+    def get_transaction_set(self) -> rpm.TransactionSet:
+        if self._transaction_set is None:
+            rpm_db_path = os.path.join(self.volume_path, 'var', 'lib', 'rpm')
+            rpm.addMacro("_dbpath", rpm_db_path)
+            self._transaction_set = rpm.TransactionSet()
+        return self._transaction_set
 
     def extract_executable(
         self,
@@ -25,18 +36,20 @@ class rpm_utils:
 
         if os.path.exists(service_file_path):
             with open(service_file_path, 'r') as file:
-                content = file.read()
-                matches = re.findall(
-                    r'(Exec(?:Start|Stop|Pre)?=)(.+)', content)
-                for match in matches:
-                    args = match[1].split()
+                for line in file:
+                    if "Exec" not in line:
+                        continue
+                    match = _EXEC_LINE_RE.search(line)
+                    if not match:
+                        continue
+                    args = match.group(2).split()
                     path = args[0].strip()
                     if os.path.isfile(path):
                         executable_paths.append(path)
-        return executable_paths
+        return list(dict.fromkeys(executable_paths))
 
     def parse_executable_path(self, command: str) -> str:
-        match = re.match(r'^[a-zA-Z0-9_./-]+', command)
+        match = _COMMAND_PATH_RE.match(command)
         if match:
             return match.group(0)
         return ""
@@ -46,8 +59,9 @@ class rpm_utils:
 
         try:
             with open(service_file_path, 'r') as file:
-                lines = file.readlines()
-                for line in lines:
+                for line in file:
+                    if "Exec" not in line:
+                        continue
                     line = line.strip()
                     if line.startswith(
                             "Exec=") or line.startswith(
@@ -63,8 +77,11 @@ class rpm_utils:
 
         return executable_paths
 
-    def display_service_info(self, organized_data) -> None:
-        data = json.loads(organized_data)
+    def display_service_info(
+            self, organized_data: Union[str, Dict[str, Any]]) -> None:
+        data = organized_data
+        if isinstance(data, str):
+            data = json.loads(data)
         table = Table(show_header=True, header_style="bold magenta")
 
         table.add_column("Package", style="cyan")
@@ -1,13 +1,13 @@
 import os
 import re
 import rpm
-import json
 import subprocess
 from typing import Dict, List, Union
 from rich import print
 
 from ..output_formatting.time_plot import RpmTimeGraphPlot
 from ..output_formatting.cdx import convert_to_cdx_rpm_chroot
+from ..output_formatting.cdx import save_cdx_output
 from ..package_utils.rpm_utils import rpm_utils
 
 
@@ -34,31 +34,28 @@ class rpm_chroot_analysis:
         )
         self.rpm_chroot_process()
 
-    def set_rpm_db_path(self):
-        rpm_db_path = os.path.join(self.volume_path, 'var', 'lib', 'rpm')
-        rpm.addMacro("_dbpath", rpm_db_path)
-
     def create_packages_json(self) -> None:
-        ts = rpm.TransactionSet()
+        ts = self.utils.get_transaction_set()
         mi = ts.dbMatch()
 
         for hdr in mi:
-            package_name = hdr[rpm.RPMTAG_NAME].decode('utf-8')
-            package_version = hdr[rpm.RPMTAG_VERSION].decode('utf-8')
             files = hdr[rpm.RPMTAG_FILENAMES]
+            if not files:
+                continue
 
-            if files:
-                service_files = [
-                    f.decode('utf-8') for f in files if f.decode(
-                        'utf-8').endswith('.service')
-                ]
+            service_files = [
+                f.decode('utf-8') for f in files if f.endswith(b'.service')
+            ]
+            if not service_files:
+                continue
 
-                if service_files:
-                    self.packages_json.setdefault(package_name, {
-                        'PackageName': package_name,
-                        'PackageVersion': package_version,
-                        'FilesAssociated': service_files
-                    })
+            package_name = hdr[rpm.RPMTAG_NAME].decode('utf-8')
+            package_version = hdr[rpm.RPMTAG_VERSION].decode('utf-8')
+            self.packages_json.setdefault(package_name, {
+                'PackageName': package_name,
+                'PackageVersion': package_version,
+                'FilesAssociated': service_files
+            })
 
     def run_bootup_analysis(self) -> None:
         try:
@@ -88,12 +85,10 @@ class rpm_chroot_analysis:
         service_times = {}
 
         with open(self.image_path, 'r') as file:
-            for line in file:
-                match = re.search(pattern, line)
-                if match:
-                    service_name = match.group(1)
-                    time = match.group(2)
-                    service_times[service_name] = time
+            data = file.read()
+
+        for match in pattern.finditer(data):
+            service_times[match.group(1)] = match.group(2)
 
         self.extracted_info = service_times
 
@@ -103,33 +98,38 @@ class rpm_chroot_analysis:
         self.create_packages_json()
 
         organized_data = {}
+        service_owners: Dict[str, Dict[str, None]] = {}
+
+        for package_name, package_data in self.packages_json.items():
+            for file_path in package_data['FilesAssociated']:
+                service_owners.setdefault(
+                    os.path.basename(file_path), {})[package_name] = None
 
         for service_name, time in self.extracted_info.items():
+            owners = service_owners.get(service_name)
+            if not owners:
+                continue
             executable_paths = self.utils.extract_executable(service_name)
             if not executable_paths:
                 continue
 
-            for package_name, package_data in self.packages_json.items():
-                if 'FilesAssociated' in package_data and isinstance(
-                        package_data['FilesAssociated'], list):
-                    for file_path in package_data['FilesAssociated']:
-                        if service_name in file_path:
-                            service_info = {
-                                'PackageVersion': package_data[
-                                    'PackageVersion'],
-                                'Time': str(time),
-                                'ExecutablePaths': executable_paths
-                            }
-
-                            if package_name not in organized_data:
-                                organized_data[package_name] = {
-                                    'PackageVersion': package_data[
-                                        'PackageVersion'],
-                                    'ServiceFiles': {}
-                                }
-
-                            organized_data[package_name]['ServiceFiles'][
-                                service_name] = service_info
+            for package_name in owners:
+                package_version = self.packages_json[package_name][
+                    'PackageVersion']
+                service_info = {
+                    'PackageVersion': package_version,
+                    'Time': str(time),
+                    'ExecutablePaths': executable_paths
+                }
+
+                if package_name not in organized_data:
+                    organized_data[package_name] = {
+                        'PackageVersion': package_version,
+                        'ServiceFiles': {}
+                    }
+
+                organized_data[package_name]['ServiceFiles'][
+                    service_name] = service_info
 
         output_json = {}
 
@@ -149,12 +149,11 @@ class rpm_chroot_analysis:
 
             output_json[package_name] = package_data
 
-        self.organized_data = json.dumps(output_json, indent=4)
+        self.organized_data = output_json
         cdx_output = convert_to_cdx_rpm_chroot(self.organized_data)
         if self.output_opt:
             try:
-                with open(self.output_opt, 'w+') as out_file:
-                    json.dump(cdx_output, out_file, indent=4)
+                save_cdx_output(cdx_output, self.output_opt)
             except Exception as e:
                 print(f"Error writing to output file: {e}")
         self.utils.display_service_info(self.organized_data)
@@ -1,6 +1,5 @@
 import os
 import rpm
-import json
 from typing import Dict
 from rich import print
 from rich.table import Table
@@ -8,6 +7,7 @@ from rich.table import Table
 from ..output_formatting.rpm_outputs import PackageServiceInfo
 from ..output_formatting.rpm_outputs import ServiceInfo
 from ..output_formatting.cdx import convert_to_cdx_rpm_static_service
+from ..output_formatting.cdx import save_cdx_output
 from ..package_utils.rpm_utils import rpm_utils
 
 
@@ -17,7 +17,6 @@ class rpm_static_analysis:
         self.volume_path: str = volume_path
         self.output_opt: str = output_opt
         self.systemd_path: str = self.get_systemd_path()
-        self.set_rpm_db_path()
         self.package_info = self.create_packages_json()
         self.service_analysis_process()
 
@@ -32,44 +31,43 @@ class rpm_static_analysis:
                 return path
         raise RuntimeError("Systemd path not found in chroot")
 
-    def set_rpm_db_path(self) -> None:
-        rpm_db_path = os.path.join(self.volume_path, 'var', 'lib', 'rpm')
-        rpm.addMacro("_dbpath", rpm_db_path)
-
     def create_packages_json(self) -> Dict[str, PackageServiceInfo]:
         package_info = {}
         self.utils = rpm_utils(
             systemd_path=self.systemd_path,
             volume_path=self.volume_path,
         )
-        ts = rpm.TransactionSet()
+        # RPM file names are absolute, anchor them under the mounted volume
+        volume_prefix = self.volume_path.rstrip(os.sep)
+        ts = self.utils.get_transaction_set()
         mi = ts.dbMatch()
 
         for hdr in mi:
-            package_name = hdr[rpm.RPMTAG_NAME].decode('utf-8')
-            package_version = hdr[rpm.RPMTAG_VERSION].decode('utf-8')
             files = hdr[rpm.RPMTAG_FILENAMES]
+            if not files:
+                continue
 
-            if files:
-                service_files = [
-                    f.decode('utf-8') for f in files if f.decode(
-                        'utf-8').endswith('.service')
-                ]
+            service_files = [
+                f.decode('utf-8') for f in files if f.endswith(b'.service')
+            ]
+            if not service_files:
+                continue
 
-                if service_files:
-                    service_info = ServiceInfo(executable_paths=set())
-                    for service_file in service_files:
-                        executable_paths = self.utils.extract_executable_paths(
-                            os.path.join(self.systemd_path, service_file))
-                        if executable_paths:
-                            service_info.executable_paths.update(
-                                executable_paths)
+            package_name = hdr[rpm.RPMTAG_NAME].decode('utf-8')
+            package_version = hdr[rpm.RPMTAG_VERSION].decode('utf-8')
+            service_info = ServiceInfo(executable_paths=set())
+            for service_file in service_files:
+                executable_paths = self.utils.extract_executable_paths(
+                    volume_prefix + service_file)
+                if executable_paths:
+                    service_info.executable_paths.update(
+                        executable_paths)
 
-                    if package_name not in package_info:
-                        package_info[package_name] = PackageServiceInfo(
-                            package_version=package_version, service_names={})
-                    package_info[package_name].service_names[
-                        service_file] = service_info
+            if package_name not in package_info:
+                package_info[package_name] = PackageServiceInfo(
+                    package_version=package_version, service_names={})
+            package_info[package_name].service_names[
+                service_file] = service_info
 
         return package_info
 
@@ -105,9 +103,7 @@ class rpm_static_analysis:
                         }
 
                 cdx_output = convert_to_cdx_rpm_static_service(normalized_data)
-                with open(self.output_opt, 'w+') as json_file:
-                    # Serialize the dictionary to a JSON string
-                    json.dump(cdx_output, json_file, indent=2)
+                save_cdx_output(cdx_output, self.output_opt)
                 print(f"Scan data saved to: {self.output_opt}")
             except Exception as e:
                 print(f"Error saving scan data to JSON file: {e}")